@@ -16,92 +16,188 @@ Usage:
     
     3. Or run standalone:
        python test_jupyter_proxy.py
+
+Request logging goes to the ``proxy_test`` logger and is silent by default
+when imported; call ``test_jupyter_proxy.configure_logging()`` to print it.
 """
 
+import atexit
+import errno
+import gzip
+import hashlib
 import http.server
+import json
+import logging
+import logging.handlers
+import mimetypes
 import os
-import socketserver
+import queue
+import socket
+import stat
+import sys
 import threading
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
+try:
+    import brotli
+except ImportError:  # optional: gzip is always available
+    brotli = None
 
-class ProxyTestHandler(http.server.SimpleHTTPRequestHandler):
-    """Custom handler that serves a test page and logs requests."""
+
+logger = logging.getLogger("proxy_test")
+logger.addHandler(logging.NullHandler())
+
+_log_listener = None
+
+# Background servers started by this process, keyed by port, as
+# (server, thread). Lets a re-run notebook cell replace its previous server
+# instead of failing.
+_background_servers = {}
+
+# Shared by every server started from this module so repeated calls to
+# start_test_server() cannot grow the number of handler threads unbounded.
+# Each open connection occupies one worker, idle keep-alive ones included,
+# so the pool is sized well above what a browser plus the proxy open at once
+# (about 6 per host). Once every worker is taken, connections are closed
+# after their current response instead of being kept alive; see
+# ProxyTestHandler.handle_one_request.
+_POOL_SIZE = 64
+_REQUEST_POOL = ThreadPoolExecutor(max_workers=_POOL_SIZE, thread_name_prefix="proxy-test")
+
+# Connections currently owned by the pool, across all servers.
+_open_connections = 0
+_open_connections_lock = threading.Lock()
+
+# The JupyterHub environment is fixed for the lifetime of the container, so
+# it is read once rather than on every request. _PROXY_PREFIX is the service
+# prefix normalised to end in "/"; the _ENV_* values are shown as-is.
+_ENV_SERVICE_PREFIX = os.environ.get("JUPYTERHUB_SERVICE_PREFIX", "Not set")
+_ENV_BASE_URL = os.environ.get("JUPYTERHUB_BASE_URL", "Not set")
+_ENV_USER = os.environ.get("JUPYTERHUB_USER", "Not set")
+_PROXY_PREFIX = os.environ.get("JUPYTERHUB_SERVICE_PREFIX", "")
+if _PROXY_PREFIX and not _PROXY_PREFIX.endswith("/"):
+    _PROXY_PREFIX += "/"
+
+# Cache-Control values per resource. The page names the current hashed
+# assets, so it is always revalidated (a cheap 304 via its ETag) and never
+# points at assets a restarted server no longer serves. The API response is
+# revalidated too so the interactive test reaches the server on every click.
+_HTML_CACHE_CONTROL = "no-cache"
+_API_CACHE_CONTROL = "no-cache"
+_STATIC_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# Plain files under /static/ come from this directory next to the module,
+# never from the current working directory.
+_STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+
+# Stylesheet and script for the test page. They are served separately under
+# content-hashed names so browsers can cache them indefinitely and reloads
+# only fetch the small HTML shell.
+_CSS_BYTES = """body {
+    font-family: Arial, sans-serif;
+    max-width: 800px;
+    margin: 50px auto;
+    padding: 20px;
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    color: white;
+}
+.container {
+    background: rgba(255, 255, 255, 0.1);
+    padding: 30px;
+    border-radius: 10px;
+    backdrop-filter: blur(10px);
+}
+h1 {
+    color: #fff;
+    text-align: center;
+}
+.info {
+    background: rgba(255, 255, 255, 0.2);
+    padding: 15px;
+    border-radius: 5px;
+    margin: 20px 0;
+}
+.success {
+    background: rgba(76, 175, 80, 0.3);
+    border-left: 4px solid #4CAF50;
+}
+code {
+    background: rgba(0, 0, 0, 0.3);
+    padding: 2px 6px;
+    border-radius: 3px;
+    font-family: 'Courier New', monospace;
+}
+.test-button {
+    background: #4CAF50;
+    color: white;
+    padding: 10px 20px;
+    border: none;
+    border-radius: 5px;
+    cursor: pointer;
+    margin: 10px 5px;
+}
+.test-button:hover {
+    background: #45a049;
+}
+#api-result {
+    margin-top: 20px;
+    padding: 10px;
+    background: rgba(0, 0, 0, 0.2);
+    border-radius: 5px;
+    min-height: 50px;
+}
+""".encode("utf-8")
+_JS_BYTES = """console.log('Jupyter Server Proxy Test Page loaded');
+console.log('Current URL:', window.location.href);
+console.log('Proxy prefix:', document.body.dataset.proxyPrefix);
+
+function testApi() {
+    const resultDiv = document.getElementById('api-result');
+    resultDiv.innerHTML = '<em>Loading...</em>';
     
-    def do_GET(self):
-        """Handle GET requests with custom test page."""
-        if self.path == "/" or self.path == "/index.html":
-            self.send_response(200)
-            self.send_header("Content-type", "text/html")
-            self.end_headers()
-            
-            # Get proxy prefix if available
-            proxy_prefix = os.environ.get("JUPYTERHUB_SERVICE_PREFIX", "")
-            if proxy_prefix and not proxy_prefix.endswith("/"):
-                proxy_prefix += "/"
-            
-            html_content = f"""
+    fetch('/api/test')
+        .then(response => response.json())
+        .then(data => {
+            resultDiv.innerHTML = `<strong>API Response:</strong><br><code>${JSON.stringify(data, null, 2)}</code>`;
+        })
+        .catch(error => {
+            resultDiv.innerHTML = `<strong style="color: #ff6b6b;">Error:</strong> ${error.message}`;
+        });
+}
+
+function testStatic() {
+    const resultDiv = document.getElementById('api-result');
+    resultDiv.innerHTML = '<em>Checking static resource...</em>';
+    
+    fetch('/static/test.txt')
+        .then(response => {
+            if (!response.ok) {
+                throw new Error(`HTTP ${response.status}`);
+            }
+            return response.text();
+        })
+        .then(data => {
+            resultDiv.innerHTML = `<strong>Static Resource:</strong><br><code>${data}</code>`;
+        })
+        .catch(error => {
+            resultDiv.innerHTML = `<strong style="color: #ff6b6b;">Note:</strong> Static resource not found (expected for basic test)`;
+        });
+}
+""".encode("utf-8")
+_CSS_HASH = hashlib.blake2b(_CSS_BYTES, digest_size=8).hexdigest()
+_JS_HASH = hashlib.blake2b(_JS_BYTES, digest_size=8).hexdigest()
+
+# Test page served at "/". Only the placeholders are filled in per request.
+_HTML_TEMPLATE = """
 <!DOCTYPE html>
 <html>
 <head>
     <title>Jupyter Server Proxy Test</title>
-    <style>
-        body {{
-            font-family: Arial, sans-serif;
-            max-width: 800px;
-            margin: 50px auto;
-            padding: 20px;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-        }}
-        .container {{
-            background: rgba(255, 255, 255, 0.1);
-            padding: 30px;
-            border-radius: 10px;
-            backdrop-filter: blur(10px);
-        }}
-        h1 {{
-            color: #fff;
-            text-align: center;
-        }}
-        .info {{
-            background: rgba(255, 255, 255, 0.2);
-            padding: 15px;
-            border-radius: 5px;
-            margin: 20px 0;
-        }}
-        .success {{
-            background: rgba(76, 175, 80, 0.3);
-            border-left: 4px solid #4CAF50;
-        }}
-        code {{
-            background: rgba(0, 0, 0, 0.3);
-            padding: 2px 6px;
-            border-radius: 3px;
-            font-family: 'Courier New', monospace;
-        }}
-        .test-button {{
-            background: #4CAF50;
-            color: white;
-            padding: 10px 20px;
-            border: none;
-            border-radius: 5px;
-            cursor: pointer;
-            margin: 10px 5px;
-        }}
-        .test-button:hover {{
-            background: #45a049;
-        }}
-        #api-result {{
-            margin-top: 20px;
-            padding: 10px;
-            background: rgba(0, 0, 0, 0.2);
-            border-radius: 5px;
-            min-height: 50px;
-        }}
-    </style>
+    <link rel="stylesheet" href="static/app.{css_hash}.css">
+    <script src="static/app.{js_hash}.js" defer></script>
 </head>
-<body>
+<body data-proxy-prefix="{proxy_prefix}">
     <div class="container">
         <h1>Jupyter Server Proxy Test Page</h1>
         
@@ -111,10 +207,10 @@ class ProxyTestHandler(http.server.SimpleHTTPRequestHandler):
         
         <div class="info">
             <h3>Connection Details:</h3>
-            <p><strong>Request Path:</strong> <code>{self.path}</code></p>
-            <p><strong>Server Port:</strong> <code>{self.server.server_address[1]}</code></p>
-            <p><strong>Proxy Prefix:</strong> <code>{proxy_prefix or "Not set (direct access)"}</code></p>
-            <p><strong>Access URL:</strong> <code>{proxy_prefix}proxy/{self.server.server_address[1]}/</code></p>
+            <p><strong>Request Path:</strong> <code>{path}</code></p>
+            <p><strong>Server Port:</strong> <code>{port}</code></p>
+            <p><strong>Proxy Prefix:</strong> <code>{prefix_label}</code></p>
+            <p><strong>Access URL:</strong> <code>{access_url}</code></p>
         </div>
         
         <div class="info">
@@ -127,9 +223,9 @@ class ProxyTestHandler(http.server.SimpleHTTPRequestHandler):
         <div class="info">
             <h3>Environment Variables:</h3>
             <ul>
-                <li><strong>JUPYTERHUB_SERVICE_PREFIX:</strong> <code>{os.environ.get("JUPYTERHUB_SERVICE_PREFIX", "Not set")}</code></li>
-                <li><strong>JUPYTERHUB_BASE_URL:</strong> <code>{os.environ.get("JUPYTERHUB_BASE_URL", "Not set")}</code></li>
-                <li><strong>JUPYTERHUB_USER:</strong> <code>{os.environ.get("JUPYTERHUB_USER", "Not set")}</code></li>
+                <li><strong>JUPYTERHUB_SERVICE_PREFIX:</strong> <code>{env_prefix}</code></li>
+                <li><strong>JUPYTERHUB_BASE_URL:</strong> <code>{env_base_url}</code></li>
+                <li><strong>JUPYTERHUB_USER:</strong> <code>{env_user}</code></li>
             </ul>
         </div>
         
@@ -143,73 +239,377 @@ class ProxyTestHandler(http.server.SimpleHTTPRequestHandler):
         </div>
     </div>
     
-    <script>
-        console.log('Jupyter Server Proxy Test Page loaded');
-        console.log('Current URL:', window.location.href);
-        console.log('Proxy prefix:', '{proxy_prefix}');
-        
-        function testApi() {{
-            const resultDiv = document.getElementById('api-result');
-            resultDiv.innerHTML = '<em>Loading...</em>';
-            
-            fetch('/api/test')
-                .then(response => response.json())
-                .then(data => {{
-                    resultDiv.innerHTML = `<strong>API Response:</strong><br><code>${{JSON.stringify(data, null, 2)}}</code>`;
-                }})
-                .catch(error => {{
-                    resultDiv.innerHTML = `<strong style="color: #ff6b6b;">Error:</strong> ${{error.message}}`;
-                }});
-        }}
-        
-        function testStatic() {{
-            const resultDiv = document.getElementById('api-result');
-            resultDiv.innerHTML = '<em>Checking static resource...</em>';
-            
-            fetch('/static/test.txt')
-                .then(response => response.text())
-                .then(data => {{
-                    resultDiv.innerHTML = `<strong>Static Resource:</strong><br><code>${{data}}</code>`;
-                }})
-                .catch(error => {{
-                    resultDiv.innerHTML = `<strong style="color: #ff6b6b;">Note:</strong> Static resource not found (expected for basic test)`;
-                }});
-        }}
-    </script>
 </body>
 </html>
 """
-            self.wfile.write(html_content.encode())
+
+
+def _etag(body):
+    """Return a strong ETag for ``body``."""
+    return '"' + hashlib.blake2b(body, digest_size=8).hexdigest() + '"'
+
+
+def _prepare(body, compress=True):
+    """
+    Precompute everything needed to serve ``body`` repeatedly.
+
+    Args:
+        body (bytes): Uncompressed response body
+        compress (bool): Also build gzip (and brotli, if installed) variants
+
+    Returns:
+        tuple: ``(variants, etag)`` where ``variants`` maps a Content-Encoding
+        to its encoded body, with ``"identity"`` always present
+    """
+    variants = {"identity": body}
+    if compress:
+        if brotli is not None:
+            variants["br"] = brotli.compress(body, quality=5)
+        variants["gzip"] = gzip.compress(body, compresslevel=6, mtime=0)
+    return variants, _etag(body)
+
+
+def _negotiate_encoding(accept_encoding, variants):
+    """Pick the preferred encoding in ``variants`` allowed by Accept-Encoding."""
+    accepted = set()
+    refused = set()
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        name, _, value = params.replace(" ", "").partition("=")
+        if name == "q":
+            try:
+                q = float(value)
+            except ValueError:
+                continue
+            if q == 0:
+                # An explicit q=0 refuses the coding even if "*" is accepted.
+                refused.add(coding)
+                continue
+        accepted.add(coding)
+    for coding in ("br", "gzip"):
+        if coding in variants and coding not in refused and (
+            coding in accepted or "*" in accepted
+        ):
+            return coding
+    return "identity"
+
+
+@lru_cache(maxsize=8)
+def _render(path, port, prefix, env_prefix, env_base_url, env_user):
+    """
+    Render the test page; cached since it only depends on its arguments.
+
+    The environment values are part of the cache key so a caller that
+    overrides them still gets a matching page.
+
+    Returns:
+        tuple: ``(variants, etag)`` as produced by ``_prepare``
+    """
+    body = _HTML_TEMPLATE.format(
+        path=path,
+        port=port,
+        prefix_label=prefix or "Not set (direct access)",
+        access_url=f"{prefix}proxy/{port}/",
+        proxy_prefix=prefix,
+        env_prefix=env_prefix,
+        env_base_url=env_base_url,
+        env_user=env_user,
+        css_hash=_CSS_HASH,
+        js_hash=_JS_HASH,
+    ).encode("utf-8")
+    return _prepare(body)
+
+
+@lru_cache(maxsize=8)
+def _render_api(port):
+    """Render the /api/test response for a server on ``port`` as ``(variants, etag)``."""
+    response = {
+        "status": "ok",
+        "message": "API endpoint working through proxy",
+        "port": port,
+        "path": "/api/test"
+    }
+    body = json.dumps(response, separators=(",", ":")).encode("utf-8")
+    # Too small for compression to pay off.
+    return _prepare(body, compress=False)
+
+
+def _send_buffers(sock, *buffers):
+    """
+    Send ``buffers`` back to back without joining them into a new bytes.
+
+    Uses scatter/gather ``sendmsg()`` where available, slicing memoryviews
+    after partial sends; otherwise each buffer is sent in turn.
+    """
+    if not hasattr(sock, "sendmsg"):
+        for buf in buffers:
+            sock.sendall(buf)
+        return
+    views = [memoryview(buf) for buf in buffers if buf]
+    while views:
+        sent = sock.sendmsg(views)
+        while views and sent >= len(views[0]):
+            sent -= len(views.pop(0))
+        if views:
+            views[0] = views[0][sent:]
+
+
+# Content-hashed assets, precompressed once at import:
+# path -> (content type, variants, etag).
+_STATIC_ASSETS = {
+    f"/static/app.{_CSS_HASH}.css": ("text/css; charset=utf-8", *_prepare(_CSS_BYTES)),
+    f"/static/app.{_JS_HASH}.js": ("text/javascript; charset=utf-8", *_prepare(_JS_BYTES)),
+}
+
+
+class ProxyTestHandler(http.server.BaseHTTPRequestHandler):
+    """Custom handler that serves a test page and logs requests."""
+
+    # Small responses such as /api/test must not wait on Nagle's algorithm.
+    disable_nagle_algorithm = True
+    # Keep connections open so the page, its API call and the favicon can
+    # share one TCP connection. Every response therefore sets Content-Length.
+    protocol_version = "HTTP/1.1"
+    # Idle keep-alive connections hold a pool worker; release them quickly.
+    timeout = 1
+
+    def handle_one_request(self):
+        """Handle one request, then drop keep-alive if the pool is full."""
+        super().handle_one_request()
+        # An idle keep-alive connection would pin a worker that queued
+        # connections are waiting for.
+        if _open_connections >= _POOL_SIZE:
+            self.close_connection = True
+    
+    def do_GET(self):
+        """Handle GET requests with custom test page."""
+        self._route(send_body=True)
+
+    def do_HEAD(self):
+        """Handle HEAD requests: same routing and headers as GET, no body."""
+        self._route(send_body=False)
+
+    def _route(self, send_body):
+        """Dispatch the request path; ``send_body`` is False for HEAD."""
+        if self.path == "/" or self.path == "/index.html":
+            variants, etag = _render(
+                self.path,
+                self.server.server_port,
+                _PROXY_PREFIX,
+                _ENV_SERVICE_PREFIX,
+                _ENV_BASE_URL,
+                _ENV_USER,
+            )
+            self._send_cached(
+                "text/html; charset=utf-8", variants, etag, _HTML_CACHE_CONTROL, send_body
+            )
             return
         
         elif self.path == "/api/test":
             # Simple API endpoint for testing
-            self.send_response(200)
-            self.send_header("Content-type", "application/json")
-            self.end_headers()
-            
-            response = {
-                "status": "ok",
-                "message": "API endpoint working through proxy",
-                "port": self.server.server_address[1],
-                "path": self.path
-            }
-            self.wfile.write(str(response).encode())
+            variants, etag = _render_api(self.server.server_port)
+            self._send_cached("application/json", variants, etag, _API_CACHE_CONTROL, send_body)
+            return
+        
+        elif self.path in _STATIC_ASSETS:
+            content_type, variants, etag = _STATIC_ASSETS[self.path]
+            self._send_cached(content_type, variants, etag, _STATIC_CACHE_CONTROL, send_body)
+            return
+        
+        elif self.path.startswith("/static/"):
+            self._send_static_file(self.path[len("/static/"):], send_body)
             return
         
         else:
-            # For other paths, try to serve files if they exist
-            super().do_GET()
+            # Nothing else is served; in particular the working directory is
+            # never exposed or scanned.
+            self._send_not_found()
     
+    def _send_not_found(self):
+        """Send an empty 404 that keeps the connection usable."""
+        self.send_response(404)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def _send_static_file(self, name, send_body=True):
+        """
+        Send ``name`` from ``_STATIC_DIR``, letting the kernel copy the file
+        to the socket with sendfile(2) where available. With ``send_body``
+        False only the headers are sent.
+        """
+        # Only plain file names directly inside the static directory.
+        if not name or "/" in name or "\\" in name or name.startswith("."):
+            self._send_not_found()
+            return
+        try:
+            f = open(os.path.join(_STATIC_DIR, name), "rb")
+        except OSError:
+            self._send_not_found()
+            return
+        with f:
+            st = os.fstat(f.fileno())
+            if not stat.S_ISREG(st.st_mode):
+                self._send_not_found()
+                return
+            content_type = mimetypes.guess_type(name)[0] or "application/octet-stream"
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(st.st_size))
+            self.send_header("Last-Modified", self.date_time_string(st.st_mtime))
+            self.end_headers()
+            if send_body:
+                # socket.sendfile() uses os.sendfile() and falls back to
+                # send() on platforms without it.
+                self.connection.sendfile(f, 0, st.st_size)
+    
+    def _send_cached(self, content_type, variants, etag, cache_control, send_body=True):
+        """
+        Send the best encoding in ``variants``, or an empty 304 if the client
+        already holds that representation. With ``send_body`` False only the
+        headers are sent, with the Content-Length the body would have.
+        """
+        encoding = _negotiate_encoding(self.headers.get("Accept-Encoding", ""), variants)
+        if encoding != "identity":
+            # Each encoded representation needs its own strong validator.
+            etag = f'{etag[:-1]}-{encoding}"'
+        body = variants[encoding]
+
+        if_none_match = self.headers.get("If-None-Match", "")
+        not_modified = etag in (tag.strip() for tag in if_none_match.split(","))
+        code = 304 if not_modified else 200
+
+        # Status line, headers and body go out together rather than one write
+        # per send_header() call, and the cached body is never copied.
+        lines = [
+            f"{self.protocol_version} {code} {self.responses[code][0]}",
+            f"Date: {self.date_time_string()}",
+            f"ETag: {etag}",
+            f"Cache-Control: {cache_control}",
+        ]
+        if len(variants) > 1:
+            lines.append("Vary: Accept-Encoding")
+        if not_modified:
+            body = b""
+        else:
+            lines.append(f"Content-Type: {content_type}")
+            if encoding != "identity":
+                lines.append(f"Content-Encoding: {encoding}")
+            lines.append(f"Content-Length: {len(body)}")
+        head = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+        if not send_body:
+            body = b""
+
+        self.log_request(code, len(body))
+        _send_buffers(self.connection, head, body)
+
     def log_message(self, format, *args):
-        """Override to add custom logging."""
-        print(f"[Proxy Test Server] {self.address_string()} - {format % args}")
+        """Route request logs through the module logger instead of stderr."""
+        logger.info("%s - " + format, self.address_string(), *args)
+
+
+class PooledThreadingHTTPServer(http.server.ThreadingHTTPServer):
+    """ThreadingHTTPServer that hands connections to a fixed-size thread pool."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+    # A page load opens several connections at once; keep the listen
+    # backlog well above the default of 5 so none are refused.
+    request_queue_size = 128
+
+    def __init__(self, *args, **kwargs):
+        self._connections = set()
+        self._connections_lock = threading.Lock()
+        super().__init__(*args, **kwargs)
+
+    def process_request(self, request, client_address):
+        """Dispatch the connection to the shared pool instead of a new thread."""
+        global _open_connections
+
+        with self._connections_lock:
+            self._connections.add(request)
+        with _open_connections_lock:
+            _open_connections += 1
+        _REQUEST_POOL.submit(self.process_request_thread, request, client_address)
+
+    def shutdown_request(self, request):
+        """Forget a finished connection before closing it."""
+        global _open_connections
+
+        with self._connections_lock:
+            if request in self._connections:
+                self._connections.discard(request)
+                with _open_connections_lock:
+                    _open_connections -= 1
+        super().shutdown_request(request)
+
+    def server_close(self):
+        """Close the listener and wake workers idling on keep-alive connections."""
+        super().server_close()
+        with self._connections_lock:
+            connections = list(self._connections)
+        for request in connections:
+            try:
+                request.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+
+def configure_logging(level=logging.INFO):
+    """
+    Print request logs to stdout without blocking the handler threads.
+
+    Records are put on a queue and written by a background
+    ``QueueListener``, so handlers never wait on the stdout lock.
+    Calling this again only updates the level.
+
+    Args:
+        level (int): Logging level for the ``proxy_test`` logger (default: INFO)
+    """
+    global _log_listener
+
+    logger.setLevel(level)
+    if _log_listener is not None:
+        return
+
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("[Proxy Test Server] %(message)s"))
+    _log_listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    _log_listener.start()
+    # The listener thread is a daemon; flush queued records on exit.
+    atexit.register(_log_listener.stop)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.propagate = False
+
+
+def _stop_background_server(port):
+    """
+    Stop the background server this process started on ``port``, if any.
+
+    Returns:
+        bool: True if a server was found and stopped
+    """
+    entry = _background_servers.pop(port, None)
+    if entry is None:
+        return False
+    httpd, thread = entry
+    httpd.shutdown()
+    thread.join()
+    httpd.server_close()
+    return True
 
 
 def start_test_server(port=9999, background=True):
     """
     Start a test web server that can be accessed through Jupyter Server Proxy.
+
+    Connections are handled on a bounded thread pool, so the page load and
+    the follow-up fetches it triggers are served concurrently.
     
+    If ``port`` is held by a background server from an earlier call, that
+    server is stopped and the port is reused.
+
     Args:
         port (int): Port number to run the server on (default: 9999)
         background (bool): Run server in background thread (default: True)
@@ -219,14 +619,19 @@ def start_test_server(port=9999, background=True):
     """
     Handler = ProxyTestHandler
     
-    try:
-        httpd = socketserver.TCPServer(("", port), Handler)
-    except OSError as e:
-        if e.errno == 48:  # Address already in use
-            print(f"\n❌ Error: Port {port} is already in use.")
-            print(f"   Try a different port or stop the existing server.\n")
-            return None
-        raise
+    for attempt in range(2):
+        try:
+            httpd = PooledThreadingHTTPServer(("", port), Handler)
+            break
+        except OSError as e:
+            if e.errno != errno.EADDRINUSE:
+                raise
+            # Retry once if the port is held by our own earlier server.
+            if attempt or not _stop_background_server(port):
+                print(f"\n❌ Error: Port {port} is already in use.")
+                print(f"   Try a different port or stop the existing server.\n")
+                return None
+            print(f"Stopped the previous test server on port {port}.")
 
     print(f"\n{'='*60}")
     print(f"  Jupyter Server Proxy Test Server")
@@ -235,11 +640,8 @@ def start_test_server(port=9999, background=True):
     print(f"  Access via proxy: /proxy/{port}/")
 
     # Check if we're in JupyterHub/Binder environment
-    prefix = os.environ.get("JUPYTERHUB_SERVICE_PREFIX", "")
-    if prefix:
-        if not prefix.endswith("/"):
-            prefix += "/"
-        print(f"  Full URL: {prefix}proxy/{port}/")
+    if _PROXY_PREFIX:
+        print(f"  Full URL: {_PROXY_PREFIX}proxy/{port}/")
 
     print(f"{'='*60}\n")
 
@@ -254,6 +656,7 @@ def start_test_server(port=9999, background=True):
 
         thread = threading.Thread(target=serve, daemon=True)
         thread.start()
+        _background_servers[port] = (httpd, thread)
         return thread
 
     try:
@@ -293,8 +696,6 @@ c.ServerProxy.servers = {
 
 
 if __name__ == "__main__":
-    import sys
-    
     # Parse command line args
     port = 9999
     if len(sys.argv) > 1:
@@ -310,4 +711,5 @@ if __name__ == "__main__":
     print("   import test_jupyter_proxy")
     print("   test_jupyter_proxy.start_test_server(port=9999)\n")
     
+    configure_logging()
     start_test_server(port=port, background=False)
@@ -0,0 +1,162 @@
+"""
+Behaviour checks for test_jupyter_proxy.
+
+Run from the repository root with:
+    python -m unittest discover -s tests
+"""
+
+import http.client
+import threading
+import unittest
+
+import test_jupyter_proxy as proxy
+
+
+class NegotiateEncodingTest(unittest.TestCase):
+    """Accept-Encoding negotiation in _negotiate_encoding."""
+
+    VARIANTS = {"identity": b"x", "gzip": b"g", "br": b"b"}
+
+    def negotiate(self, header, variants=VARIANTS):
+        return proxy._negotiate_encoding(header, variants)
+
+    def test_prefers_br_then_gzip(self):
+        self.assertEqual(self.negotiate("gzip, br"), "br")
+        self.assertEqual(self.negotiate("gzip"), "gzip")
+        self.assertEqual(self.negotiate("br", {"identity": b"x", "gzip": b"g"}), "identity")
+
+    def test_missing_header_is_identity(self):
+        self.assertEqual(self.negotiate(""), "identity")
+
+    def test_q_zero_refuses_coding(self):
+        self.assertEqual(self.negotiate("gzip;q=0"), "identity")
+        self.assertEqual(self.negotiate("br; q=0.000, gzip;q=0.5"), "gzip")
+
+    def test_wildcard_accepts_unlisted_codings(self):
+        self.assertEqual(self.negotiate("*"), "br")
+
+    def test_wildcard_does_not_override_q_zero(self):
+        self.assertEqual(self.negotiate("gzip;q=0, *", {"identity": b"x", "gzip": b"g"}), "identity")
+        self.assertEqual(self.negotiate("br;q=0, *"), "gzip")
+        self.assertEqual(self.negotiate("*;q=0"), "identity")
+
+
+class ShortSendSocket:
+    """Fake socket whose sendmsg() accepts at most ``limit`` bytes per call."""
+
+    def __init__(self, limit):
+        self.limit = limit
+        self.received = bytearray()
+        self.calls = 0
+
+    def sendmsg(self, buffers):
+        self.calls += 1
+        budget = self.limit
+        for buf in buffers:
+            chunk = bytes(buf[:budget])
+            self.received += chunk
+            budget -= len(chunk)
+            if not budget:
+                break
+        return self.limit - budget
+
+
+class NoSendmsgSocket:
+    """Fake socket without sendmsg(), as on Windows."""
+
+    def __init__(self):
+        self.received = bytearray()
+
+    def sendall(self, buf):
+        self.received += buf
+
+
+class SendBuffersTest(unittest.TestCase):
+    """_send_buffers delivers every byte in order despite short sends."""
+
+    def test_resumes_after_short_sends(self):
+        head, body = b"HTTP/1.1 200 OK\r\n\r\n", bytes(range(256)) * 4
+        for limit in (1, 3, len(head), len(head) + 1, 1000, 10_000):
+            with self.subTest(limit=limit):
+                sock = ShortSendSocket(limit)
+                proxy._send_buffers(sock, head, body)
+                self.assertEqual(bytes(sock.received), head + body)
+                self.assertEqual(sock.calls, -(-(len(head) + len(body)) // limit))
+
+    def test_skips_empty_buffers(self):
+        sock = ShortSendSocket(4)
+        proxy._send_buffers(sock, b"head", b"")
+        self.assertEqual(bytes(sock.received), b"head")
+        self.assertEqual(sock.calls, 1)
+
+    def test_falls_back_without_sendmsg(self):
+        sock = NoSendmsgSocket()
+        proxy._send_buffers(sock, b"head", b"body")
+        self.assertEqual(bytes(sock.received), b"headbody")
+
+
+class ServerTestCase(unittest.TestCase):
+    """Runs a ProxyTestHandler server on an ephemeral port for each test."""
+
+    def setUp(self):
+        self.server = proxy.PooledThreadingHTTPServer(("127.0.0.1", 0), proxy.ProxyTestHandler)
+        thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+    def request(self, method, path):
+        conn = http.client.HTTPConnection("127.0.0.1", self.server.server_port, timeout=5)
+        self.addCleanup(conn.close)
+        conn.request(method, path)
+        response = conn.getresponse()
+        return response, response.read()
+
+
+class HeadRequestTest(ServerTestCase):
+    """HEAD is routed like GET but sends no body."""
+
+    def test_head_matches_get_headers(self):
+        for path in ("/", "/api/test", "/static/test.txt"):
+            with self.subTest(path=path):
+                get, get_body = self.request("GET", path)
+                head, head_body = self.request("HEAD", path)
+                self.assertEqual(head.status, 200)
+                self.assertEqual(head_body, b"")
+                self.assertEqual(head.getheader("Content-Length"), str(len(get_body)))
+                self.assertEqual(head.getheader("Content-Type"), get.getheader("Content-Type"))
+
+    def test_head_unknown_path_is_404(self):
+        response, body = self.request("HEAD", "/missing")
+        self.assertEqual(response.status, 404)
+        self.assertEqual(body, b"")
+
+
+class StaticFileTest(ServerTestCase):
+    """Only plain file names directly inside static/ are served."""
+
+    def test_serves_file_from_static_dir(self):
+        response, body = self.request("GET", "/static/test.txt")
+        self.assertEqual(response.status, 200)
+        with open(f"{proxy._STATIC_DIR}/test.txt", "rb") as f:
+            self.assertEqual(body, f.read())
+
+    def test_rejects_names_outside_static_dir(self):
+        for path in (
+            "/static/",
+            "/static/../test_jupyter_proxy.py",
+            "/static/..\\test_jupyter_proxy.py",
+            "/static/sub/test.txt",
+            "/static/.hidden",
+            "/static/..",
+            "/static/missing.txt",
+        ):
+            with self.subTest(path=path):
+                response, body = self.request("GET", path)
+                self.assertEqual(response.status, 404)
+                self.assertEqual(body, b"")
+
+
+if __name__ == "__main__":
+    unittest.main()